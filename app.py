@@ -1,114 +1,107 @@
-from flask import Flask, render_template, request, redirect, url_for
-import sympy as sp
-from typing import Callable
+from functools import lru_cache
+
+from flask import (Flask, Response, render_template, request, redirect,
+                   url_for, stream_template, stream_with_context)
 import math
+import numpy as np
 
-app = Flask(__name__)
+from zof_solvers import (
+    parse_function,
+    bisection_method,
+    regula_falsi,
+    secant_method,
+    newton_raphson,
+    fixed_point_iteration,
+    modified_secant,
+    bisection_method_vec,
+    secant_method_vec,
+    newton_raphson_vec,
+)
 
-# Reuse the same solver implementations (import from a module would be better;
-# keeping duplication limited here for an easy single-file app).
-def parse_function(expr: str):
-    x = sp.symbols('x')
-    sym_expr = sp.sympify(expr)
-    f = sp.lambdify(x, sym_expr, 'math')
-    return f, sym_expr, x
+app = Flask(__name__)
 
-def bisection_method(f, a, b, max_iter, tol):
-    rows=[]
-    fa, fb = f(a), f(b)
-    if fa*fb > 0:
-        raise ValueError("f(a) and f(b) must have opposite signs for Bisection.")
-    for i in range(1, max_iter+1):
-        c=(a+b)/2.0
-        fc=f(c)
-        error=abs(b-a)/2.0
-        rows.append((i, a, b, c, fc, error))
-        if abs(fc)<tol or error<tol:
-            return c, abs(fc), i, rows
-        if fa*fc < 0:
-            b=c; fb=fc
-        else:
-            a=c; fa=fc
-    return c, abs(fc), max_iter, rows
+def parse_value(s):
+    """Return a float, or a numpy array when given comma-separated values."""
+    s = (s or "").strip()
+    if "," in s:
+        return np.array([float(p) for p in s.split(",") if p.strip()])
+    return float(s)
 
-def regula_falsi(f, a, b, max_iter, tol):
-    rows=[]
-    fa, fb = f(a), f(b)
-    if fa*fb > 0:
-        raise ValueError("f(a) and f(b) must have opposite signs for Regula Falsi.")
-    c=a
-    for i in range(1, max_iter+1):
-        c = (a*fb - b*fa)/(fb-fa)
-        fc = f(c)
-        error = abs(fc)
-        rows.append((i,a,b,c,fc,error))
-        if abs(fc)<tol:
-            return c, abs(fc), i, rows
-        if fa*fc < 0:
-            b=c; fb=fc
-        else:
-            a=c; fa=fc
-    return c, abs(fc), max_iter, rows
+def batch_result(roots, ferrs, iters):
+    """Summary dict plus one table row per batch entry."""
+    result = {"root": ", ".join("%.10g" % r for r in roots),
+              "final_err": float(np.max(ferrs)),
+              "iters": int(np.max(iters))}
+    rows = [(k+1, float(r), float(fe), int(n))
+            for k, (r, fe, n) in enumerate(zip(roots, ferrs, iters))]
+    return result, ["#", "root", "|f(root)|", "iters"], rows
 
-def secant_method(f, x0, x1, max_iter, tol):
-    rows=[]
-    for i in range(1, max_iter+1):
-        f0, f1 = f(x0), f(x1)
-        if (f1 - f0) == 0:
-            raise ZeroDivisionError("Zero denominator in Secant method.")
-        x2 = x1 - f1*(x1 - x0)/(f1 - f0)
-        err = abs(x2 - x1)
-        rows.append((i, x0, x1, x2, f(x2), err))
-        if abs(f(x2)) < tol or err < tol:
-            return x2, abs(f(x2)), i, rows
-        x0, x1 = x1, x2
-    return x2, abs(f(x2)), max_iter, rows
+@lru_cache(maxsize=128)
+def get_solver(method, func_str, g_str=None):
+    """Return (solver, table_headers) for a (method, expression) pair.
 
-def newton_raphson(f_expr, f, x_sym, x0, max_iter, tol):
-    df_expr = sp.diff(f_expr, x_sym)
-    df = sp.lambdify(x_sym, df_expr, 'math')
-    rows=[]
-    x=x0
-    for i in range(1, max_iter+1):
-        fx = f(x)
-        dfx = df(x)
-        if dfx == 0:
-            raise ZeroDivisionError("Zero derivative.")
-        x_new = x - fx/dfx
-        err = abs(x_new - x)
-        rows.append((i, x, fx, dfx, x_new, err))
-        if abs(fx)<tol or err<tol:
-            return x_new, abs(fx), i, rows
-        x = x_new
-    return x, abs(fx), max_iter, rows
+    All symbolic work (parsing, differentiation, jit compilation of the
+    inner loop) happens on first use and is cached, so repeated POSTs for
+    the same expression only run the numeric iteration. The solver takes
+    the dict of validated form parameters and returns (root, final_err,
+    iters, rows).
+    """
+    f, f_expr, x_sym = parse_function(func_str)
+    if method == "1":
+        headers = ["iter","a","b","c","f(c)","error"]
+        def solver(p):
+            return bisection_method(f, p["a"], p["b"], p["max_iter"], p["tol"],
+                                    f_expr=f_expr, x_sym=x_sym, keep_last=p.get("keep_last"))
+    elif method == "2":
+        headers = ["iter","a","b","c","f(c)","error"]
+        def solver(p):
+            return regula_falsi(f, p["a"], p["b"], p["max_iter"], p["tol"],
+                                f_expr=f_expr, x_sym=x_sym, keep_last=p.get("keep_last"))
+    elif method == "3":
+        headers = ["iter","x0","x1","x2","f(x2)","error"]
+        def solver(p):
+            return secant_method(f, p["x0"], p["x1"], p["max_iter"], p["tol"],
+                                 f_expr=f_expr, x_sym=x_sym, keep_last=p.get("keep_last"))
+    elif method == "4":
+        headers = ["iter","x","f(x)","f'(x)","x_new","error"]
+        def solver(p):
+            return newton_raphson(f_expr, f, x_sym, p["x0"], p["max_iter"], p["tol"],
+                                  keep_last=p.get("keep_last"))
+    elif method == "5":
+        if not g_str:
+            raise ValueError("g(x) required for Fixed Point Iteration.")
+        g, g_expr, g_sym = parse_function(g_str)
+        headers = ["iter","x","g(x)","error"]
+        def solver(p):
+            return fixed_point_iteration(g, p["x0"], p["max_iter"], p["tol"],
+                                         g_expr=g_expr, x_sym=g_sym, keep_last=p.get("keep_last"))
+    elif method == "6":
+        headers = ["iter","x","f(x)","x_new","error"]
+        def solver(p):
+            return modified_secant(f, p["x0"], p["delta"], p["max_iter"], p["tol"],
+                                   f_expr=f_expr, x_sym=x_sym, keep_last=p.get("keep_last"))
+    else:
+        raise ValueError("Invalid method.")
+    return solver, headers
 
-def fixed_point_iteration(g, x0, max_iter, tol):
-    rows=[]
-    x=x0
-    for i in range(1, max_iter+1):
-        x_new = g(x)
-        err = abs(x_new - x)
-        rows.append((i, x, x_new, err))
-        if err < tol:
-            return x_new, err, i, rows
-        x = x_new
-    return x_new, err, max_iter, rows
+def _warm_common_solvers():
+    """Run the placeholder expression through the common methods at import
+    time so the first real request doesn't pay symbolic parsing or jit
+    compilation (before_first_request is gone in current Flask)."""
+    try:
+        for method, params in (("1", {"a": 1.0, "b": 2.0}),
+                               ("3", {"x0": 1.0, "x1": 2.0}),
+                               ("4", {"x0": 1.5})):
+            solver, _ = get_solver(method, "x**3 - x - 2")
+            solver({"max_iter": 50, "tol": 1e-6, **params})
+    except Exception:
+        pass
 
-def modified_secant(f, x0, delta, max_iter, tol):
-    rows=[]
-    x=x0
-    for i in range(1, max_iter+1):
-        f_x = f(x)
-        denom = f(x + delta) - f_x
-        if denom == 0:
-            raise ZeroDivisionError("Zero denominator in Modified Secant.")
-        x_new = x - (delta * f_x)/denom
-        err = abs(x_new - x)
-        rows.append((i, x, f_x, x_new, err))
-        if abs(f_x) < tol or err < tol:
-            return x_new, abs(f_x), i, rows
-        x = x_new
-    return x_new, abs(f_x), max_iter, rows
+@app.after_request
+def add_cache_headers(response):
+    if request.method == "GET":
+        response.headers.setdefault("Cache-Control", "public, max-age=300")
+    return response
 
 @app.route("/", methods=["GET", "POST"])
 def index():
@@ -119,61 +112,82 @@ def index():
     if request.method == "POST":
         method = request.form.get("method")
         func_str = request.form.get("func").strip()
+        g_str = request.form.get("g_func", "").strip() or None
         max_iter = int(request.form.get("max_iter") or 50)
         tol = float(request.form.get("tol") or 1e-6)
+        # Never render more than 200 rows unless explicitly asked to.
+        keep_last = None if request.form.get("show_all") else 200
+        params = {"max_iter": max_iter, "tol": tol, "keep_last": keep_last}
         try:
-            if method == "5":  # Fixed point needs g
-                g_str = request.form.get("g_func","").strip()
-                if not g_str:
-                    raise ValueError("g(x) required for Fixed Point Iteration.")
-                g, _, _ = parse_function(g_str)
-            f, f_expr, x_sym = parse_function(func_str)
-            if method == "1":
-                a = float(request.form.get("a"))
-                b = float(request.form.get("b"))
-                root, final_err, iters, rows = bisection_method(f, a, b, max_iter, tol)
-                table_headers = ["iter","a","b","c","f(c)","error"]
-                table_rows = rows
-            elif method == "2":
-                a = float(request.form.get("a"))
-                b = float(request.form.get("b"))
-                root, final_err, iters, rows = regula_falsi(f, a, b, max_iter, tol)
-                table_headers = ["iter","a","b","c","f(c)","error"]
-                table_rows = rows
+            if method in ("1", "2"):
+                a = parse_value(request.form.get("a"))
+                b = parse_value(request.form.get("b"))
+                if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+                    if method != "1":
+                        raise ValueError("Batch input is only supported for "
+                                         "Bisection, Secant and Newton-Raphson.")
+                    _, f_expr, x_sym = parse_function(func_str)
+                    roots, ferrs, iters_arr = bisection_method_vec(f_expr, x_sym, a, b, max_iter, tol)
+                    result, table_headers, table_rows = batch_result(roots, ferrs, iters_arr)
+                else:
+                    params["a"] = float(a)
+                    params["b"] = float(b)
             elif method == "3":
-                x0 = float(request.form.get("x0"))
-                x1 = float(request.form.get("x1"))
-                root, final_err, iters, rows = secant_method(f, x0, x1, max_iter, tol)
-                table_headers = ["iter","x0","x1","x2","f(x2)","error"]
-                table_rows = rows
+                x0 = parse_value(request.form.get("x0"))
+                x1 = parse_value(request.form.get("x1"))
+                if isinstance(x0, np.ndarray) or isinstance(x1, np.ndarray):
+                    _, f_expr, x_sym = parse_function(func_str)
+                    roots, ferrs, iters_arr = secant_method_vec(f_expr, x_sym, x0, x1, max_iter, tol)
+                    result, table_headers, table_rows = batch_result(roots, ferrs, iters_arr)
+                else:
+                    params["x0"] = float(x0)
+                    params["x1"] = float(x1)
             elif method == "4":
-                x0 = float(request.form.get("x0"))
-                root, final_err, iters, rows = newton_raphson(f_expr, f, x_sym, x0, max_iter, tol)
-                table_headers = ["iter","x","f(x)","f'(x)","x_new","error"]
-                table_rows = rows
-            elif method == "5":
-                x0 = float(request.form.get("x0"))
-                g, _, _ = parse_function(g_str)
-                root, final_err, iters, rows = fixed_point_iteration(g, x0, max_iter, tol)
-                table_headers = ["iter","x","g(x)","error"]
+                x0 = parse_value(request.form.get("x0"))
+                if isinstance(x0, np.ndarray):
+                    _, f_expr, x_sym = parse_function(func_str)
+                    roots, ferrs, iters_arr = newton_raphson_vec(f_expr, x_sym, x0, max_iter, tol)
+                    result, table_headers, table_rows = batch_result(roots, ferrs, iters_arr)
+                else:
+                    params["x0"] = x0
+            elif method in ("5", "6"):
+                params["x0"] = float(request.form.get("x0"))
+                if method == "6":
+                    params["delta"] = float(request.form.get("delta") or 1e-3)
+            if result is None:
+                solver, table_headers = get_solver(method, func_str,
+                                                   g_str if method == "5" else None)
+                root, final_err, iters, rows = solver(params)
                 table_rows = rows
-            elif method == "6":
-                x0 = float(request.form.get("x0"))
-                delta = float(request.form.get("delta") or 1e-3)
-                root, final_err, iters, rows = modified_secant(f, x0, delta, max_iter, tol)
-                table_headers = ["iter","x","f(x)","x_new","error"]
-                table_rows = rows
-            else:
-                raise ValueError("Invalid method.")
-            result = {"root": root, "final_err": final_err, "iters": iters}
+                result = {"root": root, "final_err": final_err, "iters": iters}
         except Exception as e:
             error_msg = str(e)
 
+    if isinstance(table_rows, np.ndarray):
+        # Structured row array from the solvers; plain tuples only at render time.
+        table_rows = table_rows.tolist()
+    if table_rows:
+        # Stream the rendered page: Jinja emits the prefix and each table
+        # row as it is generated, so time-to-first-byte stays constant no
+        # matter how many iterations the table holds.
+        return Response(stream_with_context(
+            stream_template("index.html",
+                            result=result,
+                            headers=table_headers,
+                            rows=table_rows,
+                            error=error_msg)))
     return render_template("index.html",
                            result=result,
                            headers=table_headers,
                            rows=table_rows,
                            error=error_msg)
 
+_warm_common_solvers()
+
 if __name__ == "__main__":
-    app.run(debug=True)
+    try:
+        from waitress import serve
+    except ImportError:  # dev fallback; production deploys use the Procfile
+        app.run(debug=True)
+    else:
+        serve(app, host="0.0.0.0", port=5000, threads=8)
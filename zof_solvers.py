@@ -0,0 +1,786 @@
+#!/usr/bin/env python3
+"""
+zof_solvers.py
+Zero Of Functions (ZOF) Solver - shared numerical core
+
+Single home for expression parsing and the six root-finding methods so the
+CLI and the Flask app run the same code.
+
+parse_function is memoized on the expression string: repeated calls with the
+same f(x) (e.g. repeated POSTs to the web app) reuse one lambdified callable
+instead of re-running sympy parsing and code generation, which also avoids
+the linecache growth that a fresh lambdify per call causes.  Pure-numeric
+expressions short-circuit to a plain closure without invoking lambdify.
+
+When numba is installed, each method additionally compiles a jitted inner
+loop (closing over a jitted f kernel) so the whole iteration runs as native
+code instead of paying CPython dispatch per f-call.  The pure-Python loops
+are kept as the fallback when numba is missing or a kernel fails to compile.
+"""
+import functools
+import hashlib
+from collections import deque
+import importlib.util
+import inspect
+import math
+import os
+import tempfile
+from typing import Callable, Tuple, List, Any, Optional
+import numpy as np
+import sympy as sp
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; everything falls back to pure Python
+    njit = None
+
+try:
+    import joblib
+    # Persistent symbolic cache: identical expressions across CLI runs / web
+    # worker restarts skip re-parsing and re-differentiation.
+    _sym_cache = joblib.Memory('.zof_cache', verbose=0)
+    _disk_cached = _sym_cache.cache
+except ImportError:  # joblib is optional; caching is then in-process only
+    _sym_cache = None
+    def _disk_cached(fn):
+        return fn
+
+# math.fma (Python 3.13+) computes x*y + z with a single rounding; the
+# fallback keeps the same call shape on older interpreters.
+_fma = math.fma if hasattr(math, "fma") else (lambda x, y, z: x*y + z)
+
+# --- Parsing / compilation helpers ---
+@_disk_cached
+def _sympify_srepr(expr_str: str) -> str:
+    """Parse expr_str and return its srepr; the srepr round-trips cheaply."""
+    return sp.srepr(sp.sympify(expr_str))
+
+@_disk_cached
+def _diff_srepr(srepr_str: str, var_name: str) -> str:
+    """Differentiate the srepr'd expression w.r.t. var_name, as srepr."""
+    e = sp.sympify(srepr_str)
+    return sp.srepr(sp.diff(e, sp.Symbol(var_name)))
+
+@functools.lru_cache(maxsize=256)
+def parse_function(expr: str, var_symbol='x') -> Tuple[Callable[[float], float], sp.Expr, sp.Symbol]:
+    """Return (callable, sympy_expr, sympy_symbol). Cached per (expr, var_symbol)."""
+    x = sp.symbols(var_symbol)
+    try:
+        sym_expr = sp.sympify(_sympify_srepr(expr))
+    except Exception as e:
+        raise ValueError(f"Can't parse expression: {e}")
+    if sym_expr.is_number:
+        # Constant f(x): no code generation needed.
+        value = float(sym_expr)
+        def f(_x, _value=value):
+            return _value
+        return f, sym_expr, x
+    f = _as_polynomial(sym_expr, x)
+    if f is None:
+        f = _autowrap_f(sym_expr, x)
+    if f is None:
+        f = sp.lambdify(x, sym_expr, 'math')
+    return f, sym_expr, x
+
+@functools.lru_cache(maxsize=256)
+def _diff_cached(f_expr: sp.Expr, x_sym: sp.Symbol) -> sp.Expr:
+    """Differentiate f_expr once per expression.
+
+    Two-tier cache: lru_cache keys on the hashable sympy expression, so
+    in-process hits (Newton restarts on the same f) are a plain dict
+    lookup with no pickling; misses fall through to the joblib-backed
+    _diff_srepr so the symbolic work also persists across processes.
+    The maxsize bound doubles as the eviction policy.
+    """
+    return sp.sympify(_diff_srepr(sp.srepr(f_expr), x_sym.name))
+
+@functools.lru_cache(maxsize=256)
+def _fdf_lambdified(f_expr: sp.Expr, x_sym: sp.Symbol) -> Tuple[sp.Expr, Callable[[float], Tuple[float, float]]]:
+    """Cache (df_expr, fdf) where fdf(x) returns (f(x), f'(x)) in one call.
+
+    f and f' usually share most of their subexpressions; lambdifying them
+    together with cse=True runs sp.cse over the pair so shared terms are
+    evaluated once per iteration instead of once per function.
+    """
+    df_expr = _diff_cached(f_expr, x_sym)
+    return df_expr, sp.lambdify(x_sym, [f_expr, df_expr], 'math', cse=True)
+
+@functools.lru_cache(maxsize=256)
+def _pair_lambdified(f_expr: sp.Expr, x_sym: sp.Symbol) -> Callable[[float, float], Tuple[float, float]]:
+    """Cache fpair(x, d) returning (f(x), f(x+d)) with shared terms factored via cse.
+
+    One 2-output scalar call beats evaluating a length-2 array through a
+    numpy-lambdified f by an order of magnitude here: ndarray construction
+    and ufunc dispatch dominate at n=2, while this stays in plain math
+    calls and still shares the cse'd subexpressions between the two points.
+    """
+    d = sp.Symbol('__d')
+    # xreplace: exact-node swap, much cheaper than the matching logic in subs.
+    shifted = f_expr.xreplace({x_sym: x_sym + d})
+    return sp.lambdify((x_sym, d), [f_expr, shifted], 'math', cse=True)
+
+@functools.lru_cache(maxsize=256)
+def _as_polynomial(sym_expr: sp.Expr, x_sym: sp.Symbol):
+    """numpy Polynomial for polynomial expressions of degree <= 20, else None.
+
+    Polynomial.__call__ evaluates via C-level Horner (polyval), so the
+    dominant textbook input class skips lambdify and Python math dispatch
+    entirely; its derivative is algebraic (deriv()) rather than symbolic.
+    """
+    try:
+        poly = sp.Poly(sym_expr, x_sym)
+    except sp.PolynomialError:
+        return None
+    if poly.degree() > 20:
+        return None
+    try:
+        coeffs = [float(c) for c in poly.all_coeffs()]
+    except (TypeError, ValueError):  # symbolic/complex coefficients
+        return None
+    return np.polynomial.Polynomial(coeffs[::-1])
+
+@functools.lru_cache(maxsize=256)
+def _np_f(f_expr: sp.Expr, x_sym: sp.Symbol) -> Callable[[np.ndarray], np.ndarray]:
+    """Cache a numpy-backed callable evaluating f_expr over whole arrays.
+
+    Constant expressions are broadcast to the input shape so callers always
+    get an array back.
+    """
+    raw = _as_polynomial(f_expr, x_sym)
+    if raw is None:
+        raw = sp.lambdify(x_sym, f_expr, 'numpy')
+    def f(arr):
+        vals = np.asarray(raw(arr), dtype=float)
+        if vals.shape != np.shape(arr):
+            vals = np.full(np.shape(arr), float(vals))
+        return vals
+    return f
+
+# --- Optional compiled-C kernels via sympy.autowrap ---
+_AUTOWRAP_DIR = os.path.join(tempfile.gettempdir(), 'zof_autowrap')
+_AUTOWRAP_ENABLED = os.environ.get('ZOF_AUTOWRAP', '').lower() in ('1', 'true', 'yes')
+_autowrap_broken = False
+
+def _load_autowrapped(cache_dir, digest):
+    """Reload a previously compiled wrapper module from cache_dir, if any."""
+    if not os.path.isdir(cache_dir):
+        return None
+    for name in sorted(os.listdir(cache_dir)):
+        if name.startswith('wrapper_module_') and name.endswith('.so'):
+            # The .so must be loaded under its original module name so its
+            # PyInit_ symbol resolves; the digest is unused in the name.
+            spec = importlib.util.spec_from_file_location(
+                name.split('.')[0], os.path.join(cache_dir, name))
+            mod = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(mod)
+            return mod.autofunc_c
+    return None
+
+@functools.lru_cache(maxsize=128)
+def _autowrap_f(f_expr: sp.Expr, x_sym: sp.Symbol):
+    """Compiled C extension evaluating f_expr, or None.
+
+    Opt-in via ZOF_AUTOWRAP=1, aimed at workloads that call f many
+    thousands of times: the first call per expression pays a cython/C
+    compile, but the build lands in a per-expression cache directory
+    (hashed srepr) so later processes reload the shared library instead of
+    recompiling.  Any toolchain failure disables the path for the rest of
+    the process and callers fall back to lambdify.
+    """
+    global _autowrap_broken
+    if not _AUTOWRAP_ENABLED or _autowrap_broken or f_expr.is_number:
+        return None
+    digest = hashlib.sha256(sp.srepr(f_expr).encode()).hexdigest()[:16]
+    cache_dir = os.path.join(_AUTOWRAP_DIR, digest)
+    try:
+        fn = _load_autowrapped(cache_dir, digest)
+        if fn is not None:
+            return fn
+        from sympy.utilities.autowrap import autowrap, CodeWrapper
+        os.makedirs(cache_dir, exist_ok=True)
+        # Derive the wrapper module counter from the digest: every build
+        # would otherwise be wrapper_module_0, and the interpreter caches
+        # extension modules by name, so a second expression would silently
+        # get the first one's compiled f.
+        CodeWrapper._module_counter = int(digest, 16) % 10**9
+        return autowrap(f_expr, args=[x_sym], backend='cython', tempdir=cache_dir)
+    except Exception:
+        _autowrap_broken = True
+        return None
+
+# --- Optional numba-jitted kernels ---
+_JIT_DIR = os.path.join(tempfile.gettempdir(), 'zof_jit')
+
+def _jit_function(f):
+    """njit-compile a lambdified scalar callable.
+
+    lambdify only registers its generated code in linecache, which numba
+    cannot cache from, so the source is written to a stable temp module
+    (named by content hash), recompiled from that file, and jitted with
+    cache=True so the native code survives across processes.
+    """
+    src = inspect.getsource(f)
+    digest = hashlib.sha256(src.encode()).hexdigest()[:16]
+    os.makedirs(_JIT_DIR, exist_ok=True)
+    path = os.path.join(_JIT_DIR, f"zof_kernel_{digest}.py")
+    if not os.path.exists(path):
+        with open(path, 'w') as fh:
+            fh.write(src)
+    ns = dict(f.__globals__)
+    exec(compile(src, path, 'exec'), ns)
+    fn = ns[f.__name__]
+    jf = njit(cache=True)(fn)
+    jf.compile("float64(float64)")  # compile eagerly so failures surface here
+    return jf
+
+@functools.lru_cache(maxsize=128)
+def _jit_f(f_expr: sp.Expr, x_sym: sp.Symbol):
+    """Jitted scalar kernel for f_expr, or None if numba is unavailable or compilation fails."""
+    if njit is None:
+        return None
+    try:
+        return _jit_function(sp.lambdify(x_sym, f_expr, 'math'))
+    except Exception:
+        return None
+
+def _make_bisection_jit(f_jit):
+    @njit
+    def solver(a, b, fa, fb, max_iter, tol, table):
+        c = a
+        fc = fa
+        i = 0
+        while i < max_iter:
+            c = (a + b)/2.0
+            fc = f_jit(c)
+            error = abs(b - a)/2.0
+            table[i, 0] = i + 1
+            table[i, 1] = a
+            table[i, 2] = b
+            table[i, 3] = c
+            table[i, 4] = fc
+            table[i, 5] = error
+            i += 1
+            if abs(fc) < tol or error < tol:
+                break
+            # Branchless blend: s is 1.0 when the root is in [a, c]. Avoids a
+            # data-dependent branch the CPU cannot predict on sign flips.
+            s = 1.0*(fa*fc < 0.0)
+            t = 1.0 - s
+            b = s*c + t*b
+            fb = s*fc + t*fb
+            a = t*c + s*a
+            fa = t*fc + s*fa
+        return c, abs(fc), i
+    return solver
+
+def _make_regula_falsi_jit(f_jit):
+    @njit
+    def solver(a, b, fa, fb, max_iter, tol, table):
+        c = a
+        fc = fa
+        i = 0
+        while i < max_iter:
+            c = (a*fb - b*fa)/(fb - fa)
+            fc = f_jit(c)
+            error = abs(fc)
+            table[i, 0] = i + 1
+            table[i, 1] = a
+            table[i, 2] = b
+            table[i, 3] = c
+            table[i, 4] = fc
+            table[i, 5] = error
+            i += 1
+            if abs(fc) < tol:
+                break
+            # Same branchless blend as bisection.
+            s = 1.0*(fa*fc < 0.0)
+            t = 1.0 - s
+            b = s*c + t*b
+            fb = s*fc + t*fb
+            a = t*c + s*a
+            fa = t*fc + s*fa
+        return c, abs(fc), i
+    return solver
+
+def _make_secant_jit(f_jit):
+    @njit
+    def solver(x0, x1, max_iter, tol, table):
+        # f0/f1 are seeded once and carried forward: one f-call per iteration.
+        f0 = f_jit(x0)
+        f1 = f_jit(x1)
+        x2 = x1
+        f2 = f1
+        i = 0
+        while i < max_iter:
+            if (f1 - f0) == 0:
+                raise ZeroDivisionError("Zero denominator in Secant method.")
+            dx = (x1 - x0)/(f1 - f0)
+            x2 = x1 - f1*dx
+            err = abs(x2 - x1)
+            f2 = f_jit(x2)
+            table[i, 0] = i + 1
+            table[i, 1] = x0
+            table[i, 2] = x1
+            table[i, 3] = x2
+            table[i, 4] = f2
+            table[i, 5] = err
+            i += 1
+            if err < tol or abs(f2) < tol:
+                break
+            x0 = x1
+            x1 = x2
+            f0 = f1
+            f1 = f2
+        return x2, abs(f2), i
+    return solver
+
+def _make_newton_jit(f_jit, df_jit):
+    @njit
+    def solver(x0, max_iter, tol, table):
+        # fx is carried across iterations: one f-call plus one df-call each.
+        x = x0
+        fx = f_jit(x)
+        i = 0
+        while i < max_iter:
+            if abs(fx) < tol:
+                # x is already a root to tolerance: skip the derivative.
+                return x, abs(fx), i
+            dfx = df_jit(x)
+            if dfx == 0:
+                raise ZeroDivisionError("Zero derivative.")
+            x_new = x - fx/dfx
+            err = abs(x_new - x)
+            table[i, 0] = i + 1
+            table[i, 1] = x
+            table[i, 2] = fx
+            table[i, 3] = dfx
+            table[i, 4] = x_new
+            table[i, 5] = err
+            i += 1
+            if err < tol:
+                return x_new, abs(fx), i
+            x = x_new
+            if i < max_iter:
+                fx = f_jit(x)
+        return x, abs(fx), i
+    return solver
+
+def _make_fixed_point_jit(g_jit):
+    @njit
+    def solver(x0, max_iter, tol, table):
+        x = x0
+        x_new = x0
+        err = 0.0
+        i = 0
+        while i < max_iter:
+            x_new = g_jit(x)
+            err = abs(x_new - x)
+            table[i, 0] = i + 1
+            table[i, 1] = x
+            table[i, 2] = x_new
+            table[i, 3] = err
+            i += 1
+            if err < tol:
+                break
+            x = x_new
+        return x_new, err, i
+    return solver
+
+def _make_modified_secant_jit(f_jit):
+    @njit
+    def solver(x0, delta, max_iter, tol, table):
+        # f_x is carried across iterations: one new f-call per step plus the
+        # perturbed point.
+        x = x0
+        x_new = x0
+        f_x = f_jit(x0)
+        i = 0
+        while i < max_iter:
+            denom = f_jit(x + delta) - f_x
+            if denom == 0:
+                raise ZeroDivisionError("Zero denominator in Modified Secant.")
+            x_new = x - (delta * f_x) / denom
+            err = abs(x_new - x)
+            table[i, 0] = i + 1
+            table[i, 1] = x
+            table[i, 2] = f_x
+            table[i, 3] = x_new
+            table[i, 4] = err
+            i += 1
+            if abs(f_x) < tol or err < tol:
+                break
+            x = x_new
+            if i < max_iter:
+                f_x = f_jit(x)
+        return x_new, abs(f_x), i
+    return solver
+
+_JIT_FACTORIES = {
+    'bisection': _make_bisection_jit,
+    'regula_falsi': _make_regula_falsi_jit,
+    'secant': _make_secant_jit,
+    'newton': _make_newton_jit,
+    'fixed_point': _make_fixed_point_jit,
+    'modified_secant': _make_modified_secant_jit,
+}
+
+@functools.lru_cache(maxsize=128)
+def _jit_solver(method: str, f_expr: sp.Expr, x_sym: sp.Symbol):
+    """Jitted solver closure for (method, f_expr), or None when jit is unavailable.
+
+    Cached so repeated solves of the same expression skip both lambdify and
+    the (expensive) numba compilation of the closure.
+    """
+    f_jit = _jit_f(f_expr, x_sym)
+    if f_jit is None:
+        return None
+    if method == 'newton':
+        df_jit = _jit_f(_diff_cached(f_expr, x_sym), x_sym)
+        if df_jit is None:
+            return None
+        return _JIT_FACTORIES[method](f_jit, df_jit)
+    return _JIT_FACTORIES[method](f_jit)
+
+# Structured row schemas: each solve fills one preallocated typed array
+# (i4 iteration counter, f8 numerics) instead of appending a Python list of
+# boxed floats per iteration.
+_BRACKET_ROW = np.dtype([('iter','i4'),('a','f8'),('b','f8'),('c','f8'),('fc','f8'),('err','f8')])
+_SECANT_ROW = np.dtype([('iter','i4'),('x0','f8'),('x1','f8'),('x2','f8'),('fx2','f8'),('err','f8')])
+_NEWTON_ROW = np.dtype([('iter','i4'),('x','f8'),('fx','f8'),('dfx','f8'),('x_new','f8'),('err','f8')])
+_FIXED_ROW = np.dtype([('iter','i4'),('x','f8'),('x_new','f8'),('err','f8')])
+_MODSEC_ROW = np.dtype([('iter','i4'),('x','f8'),('fx','f8'),('x_new','f8'),('err','f8')])
+
+def _rows_out(rows, count, keep_last):
+    """Recorded rows: a structured-array slice, or the deque tail as a list."""
+    return rows[:count] if keep_last is None else list(rows)
+
+def _as_rows(table, iters, dtype) -> np.ndarray:
+    """Repack a jit-filled float table into the method's structured row array."""
+    rows = np.empty(iters, dtype=dtype)
+    for k, name in enumerate(dtype.names):
+        rows[name] = table[:iters, k]
+    return rows
+
+# --- Methods ---
+def bisection_method(f: Callable[[float], float], a: float, b: float, max_iter:int, tol:float,
+                     f_expr: sp.Expr = None, x_sym: sp.Symbol = None,
+                     keep_last: Optional[int] = None):
+    if keep_last is not None and keep_last >= max_iter:
+        keep_last = None  # the full history fits; keep the fast path
+    fa, fb = f(a), f(b)
+    if fa*fb > 0:
+        raise ValueError("f(a) and f(b) must have opposite signs for Bisection.")
+    if f_expr is not None and x_sym is not None and keep_last is None:
+        solver = _jit_solver('bisection', f_expr, x_sym)
+        if solver is not None:
+            table = np.empty((max_iter, 6))
+            root, ferr, iters = solver(a, b, fa, fb, max_iter, tol, table)
+            return root, ferr, iters, _as_rows(table, iters, _BRACKET_ROW)
+    # keep_last bounds memory for pathological max_iter: only the last k rows
+    # survive in a fixed-size ring buffer instead of the full table.
+    rows = np.empty(max_iter, dtype=_BRACKET_ROW) if keep_last is None else deque(maxlen=keep_last)
+    _abs = abs  # local binding: skips a LOAD_GLOBAL per use in the hot loop
+    for i in range(1, max_iter+1):
+        c = (a + b)/2.0
+        fc = f(c)
+        error = _abs(b - a)/2.0
+        if keep_last is None:
+            rows[i-1] = (i, a, b, c, fc, error)
+        else:
+            rows.append((i, a, b, c, fc, error))
+        if _abs(fc) < tol or error < tol:
+            return c, _abs(fc), i, _rows_out(rows, i, keep_last)
+        # Branchless blend, mirroring the jitted kernel.
+        s = 1.0*(fa*fc < 0.0)
+        t = 1.0 - s
+        b = s*c + t*b
+        fb = s*fc + t*fb
+        a = t*c + s*a
+        fa = t*fc + s*fa
+    return c, _abs(fc), max_iter, _rows_out(rows, max_iter, keep_last)
+
+def regula_falsi(f: Callable[[float], float], a: float, b: float, max_iter:int, tol:float,
+                 f_expr: sp.Expr = None, x_sym: sp.Symbol = None,
+                 keep_last: Optional[int] = None):
+    if keep_last is not None and keep_last >= max_iter:
+        keep_last = None  # the full history fits; keep the fast path
+    fa, fb = f(a), f(b)
+    if fa*fb > 0:
+        raise ValueError("f(a) and f(b) must have opposite signs for Regula Falsi.")
+    if f_expr is not None and x_sym is not None and keep_last is None:
+        solver = _jit_solver('regula_falsi', f_expr, x_sym)
+        if solver is not None:
+            table = np.empty((max_iter, 6))
+            root, ferr, iters = solver(a, b, fa, fb, max_iter, tol, table)
+            return root, ferr, iters, _as_rows(table, iters, _BRACKET_ROW)
+    rows = np.empty(max_iter, dtype=_BRACKET_ROW) if keep_last is None else deque(maxlen=keep_last)
+    _abs = abs
+    c = a
+    for i in range(1, max_iter+1):
+        # Fused multiply-add: a*fb - b*fa rounds once near convergence,
+        # where the two products nearly cancel.
+        c = _fma(a, fb, -(b*fa))/(fb - fa)
+        fc = f(c)
+        error = _abs(fc)
+        if keep_last is None:
+            rows[i-1] = (i, a, b, c, fc, error)
+        else:
+            rows.append((i, a, b, c, fc, error))
+        if error < tol:
+            return c, error, i, _rows_out(rows, i, keep_last)
+        # Branchless blend, mirroring the jitted kernel.
+        s = 1.0*(fa*fc < 0.0)
+        t = 1.0 - s
+        b = s*c + t*b
+        fb = s*fc + t*fb
+        a = t*c + s*a
+        fa = t*fc + s*fa
+    return c, _abs(fc), max_iter, _rows_out(rows, max_iter, keep_last)
+
+def secant_method(f: Callable[[float], float], x0: float, x1: float, max_iter:int, tol:float,
+                  f_expr: sp.Expr = None, x_sym: sp.Symbol = None,
+                  keep_last: Optional[int] = None):
+    if keep_last is not None and keep_last >= max_iter:
+        keep_last = None  # the full history fits; keep the fast path
+    if f_expr is not None and x_sym is not None and keep_last is None:
+        solver = _jit_solver('secant', f_expr, x_sym)
+        if solver is not None:
+            table = np.empty((max_iter, 6))
+            root, ferr, iters = solver(x0, x1, max_iter, tol, table)
+            return root, ferr, iters, _as_rows(table, iters, _SECANT_ROW)
+    rows = np.empty(max_iter, dtype=_SECANT_ROW) if keep_last is None else deque(maxlen=keep_last)
+    _abs = abs
+    # Seed f0/f1 once and carry them forward: one f-call per iteration
+    # instead of re-evaluating f(x0), f(x1) and f(x2) separately.
+    f0, f1 = f(x0), f(x1)
+    for i in range(1, max_iter+1):
+        if (f1 - f0) == 0:
+            raise ZeroDivisionError("Zero denominator in Secant method.")
+        # Precompute the inverse slope so the update is a single multiply-add.
+        dx = (x1 - x0)/(f1 - f0)
+        x2 = x1 - f1*dx
+        err = _abs(x2 - x1)
+        f2 = f(x2)
+        if keep_last is None:
+            rows[i-1] = (i, x0, x1, x2, f2, err)
+        else:
+            rows.append((i, x0, x1, x2, f2, err))
+        # err is already in hand; test it before the function-value test.
+        if err < tol or _abs(f2) < tol:
+            return x2, _abs(f2), i, _rows_out(rows, i, keep_last)
+        x0, x1 = x1, x2
+        f0, f1 = f1, f2
+    return x2, _abs(f2), max_iter, _rows_out(rows, max_iter, keep_last)
+
+def newton_raphson(f_expr: sp.Expr, f: Callable[[float], float], x_sym: sp.Symbol, x0: float, max_iter:int, tol:float,
+                   keep_last: Optional[int] = None):
+    if keep_last is not None and keep_last >= max_iter:
+        keep_last = None  # the full history fits; keep the fast path
+    solver = _jit_solver('newton', f_expr, x_sym) if keep_last is None else None
+    if solver is not None:
+        table = np.empty((max_iter, 6))
+        root, ferr, iters = solver(x0, max_iter, tol, table)
+        return root, ferr, iters, _as_rows(table, iters, _NEWTON_ROW)
+    # Separate f/df callables (polynomial, autowrap) let the loop test
+    # |f(x)| before paying for the derivative; the lambdified fallback
+    # evaluates both through one cse'd pair call, so it stays fused.
+    feval = dfeval = fdf = None
+    fp = _as_polynomial(f_expr, x_sym)
+    if fp is not None:
+        # Horner-evaluated polynomial and its algebraic derivative.
+        feval, dfeval = fp, fp.deriv()
+    else:
+        f_c = _autowrap_f(f_expr, x_sym)
+        if f_c is not None:
+            df_c = _autowrap_f(_diff_cached(f_expr, x_sym), x_sym)
+            if df_c is not None:
+                feval, dfeval = f_c, df_c
+    if feval is None:
+        _, fdf = _fdf_lambdified(f_expr, x_sym)
+    rows = np.empty(max_iter, dtype=_NEWTON_ROW) if keep_last is None else deque(maxlen=keep_last)
+    _abs = abs
+    x = x0
+    fx = feval(x) if fdf is None else None
+    dfx = 0.0
+    for i in range(1, max_iter+1):
+        if fdf is not None:
+            fx, dfx = fdf(x)
+        if _abs(fx) < tol:
+            # x is already a root to tolerance: skip the derivative and step.
+            return x, _abs(fx), i-1, _rows_out(rows, i-1, keep_last)
+        if fdf is None:
+            dfx = dfeval(x)
+        if dfx == 0:
+            raise ZeroDivisionError("Zero derivative at x = {:.6g}".format(x))
+        x_new = x - fx/dfx
+        err = _abs(x_new - x)
+        if keep_last is None:
+            rows[i-1] = (i, x, fx, dfx, x_new, err)
+        else:
+            rows.append((i, x, fx, dfx, x_new, err))
+        if err < tol:
+            return x_new, _abs(fx), i, _rows_out(rows, i, keep_last)
+        x = x_new
+        if fdf is None and i < max_iter:
+            fx = feval(x)
+    return x, _abs(fx), max_iter, _rows_out(rows, max_iter, keep_last)
+
+def fixed_point_iteration(g: Callable[[float], float], x0: float, max_iter:int, tol:float,
+                          g_expr: sp.Expr = None, x_sym: sp.Symbol = None,
+                          keep_last: Optional[int] = None):
+    if keep_last is not None and keep_last >= max_iter:
+        keep_last = None  # the full history fits; keep the fast path
+    if g_expr is not None and x_sym is not None and keep_last is None:
+        solver = _jit_solver('fixed_point', g_expr, x_sym)
+        if solver is not None:
+            table = np.empty((max_iter, 4))
+            root, err, iters = solver(x0, max_iter, tol, table)
+            return root, err, iters, _as_rows(table, iters, _FIXED_ROW)
+    rows = np.empty(max_iter, dtype=_FIXED_ROW) if keep_last is None else deque(maxlen=keep_last)
+    _abs = abs
+    x = x0
+    for i in range(1, max_iter+1):
+        x_new = g(x)
+        err = _abs(x_new - x)
+        # Convergence is decided before the row write; only the converged
+        # branch records its final row on the way out.
+        if err < tol:
+            if keep_last is None:
+                rows[i-1] = (i, x, x_new, err)
+            else:
+                rows.append((i, x, x_new, err))
+            return x_new, err, i, _rows_out(rows, i, keep_last)
+        if keep_last is None:
+            rows[i-1] = (i, x, x_new, err)
+        else:
+            rows.append((i, x, x_new, err))
+        x = x_new
+    return x_new, err, max_iter, _rows_out(rows, max_iter, keep_last)
+
+def modified_secant(f: Callable[[float], float], x0: float, delta: float, max_iter:int, tol:float,
+                    f_expr: sp.Expr = None, x_sym: sp.Symbol = None,
+                    keep_last: Optional[int] = None):
+    if keep_last is not None and keep_last >= max_iter:
+        keep_last = None  # the full history fits; keep the fast path
+    fpair = None
+    if f_expr is not None and x_sym is not None:
+        solver = _jit_solver('modified_secant', f_expr, x_sym) if keep_last is None else None
+        if solver is not None:
+            table = np.empty((max_iter, 5))
+            root, ferr, iters = solver(x0, delta, max_iter, tol, table)
+            return root, ferr, iters, _as_rows(table, iters, _MODSEC_ROW)
+        fpair = _pair_lambdified(f_expr, x_sym)
+    rows = np.empty(max_iter, dtype=_MODSEC_ROW) if keep_last is None else deque(maxlen=keep_last)
+    _abs = abs
+    x = x0
+    # On the plain-callable path f(x) is carried across iterations; the pair
+    # path gets both points from one cse'd call anyway.
+    f_x = f(x0) if fpair is None else 0.0
+    for i in range(1, max_iter+1):
+        if fpair is not None:
+            f_x, f_xd = fpair(x, delta)
+        else:
+            f_xd = f(x + delta)
+        denom = f_xd - f_x
+        if denom == 0:
+            raise ZeroDivisionError("Zero denominator in Modified Secant.")
+        x_new = x - (delta * f_x) / denom
+        err = _abs(x_new - x)
+        if keep_last is None:
+            rows[i-1] = (i, x, f_x, x_new, err)
+        else:
+            rows.append((i, x, f_x, x_new, err))
+        if _abs(f_x) < tol or err < tol:
+            return x_new, _abs(f_x), i, _rows_out(rows, i, keep_last)
+        x = x_new
+        if fpair is None and i < max_iter:
+            f_x = f(x)
+    return x_new, _abs(f_x), max_iter, _rows_out(rows, max_iter, keep_last)
+
+# --- Vectorized variants (batch root-finding over arrays of start values) ---
+def bisection_method_vec(f_expr: sp.Expr, x_sym: sp.Symbol, a, b, max_iter:int, tol:float):
+    """Solve f(x)=0 for arrays of brackets [a_k, b_k] in one numpy sweep.
+
+    Returns (roots, |f(root)|, iters) arrays.  Converged entries are frozen
+    via a boolean active mask while the rest keep iterating, so one call
+    replaces a Python loop over the scalar solver.
+    """
+    f = _np_f(f_expr, x_sym)
+    a, b = np.broadcast_arrays(np.atleast_1d(np.asarray(a, dtype=float)),
+                               np.atleast_1d(np.asarray(b, dtype=float)))
+    a, b = a.copy(), b.copy()
+    fa, fb = f(a), f(b)
+    if np.any(fa*fb > 0):
+        raise ValueError("f(a) and f(b) must have opposite signs for Bisection.")
+    c = 0.5*(a + b)
+    fc = f(c)
+    active = np.ones(a.shape, dtype=bool)
+    iters = np.zeros(a.shape, dtype=np.int64)
+    for _ in range(max_iter):
+        c_new = 0.5*(a + b)
+        fc_new = f(c_new)
+        c = np.where(active, c_new, c)
+        fc = np.where(active, fc_new, fc)
+        iters += active
+        error = 0.5*np.abs(b - a)
+        left = active & (fa*fc < 0)
+        right = active & ~(fa*fc < 0)
+        b = np.where(left, c, b)
+        fb = np.where(left, fc, fb)
+        a = np.where(right, c, a)
+        fa = np.where(right, fc, fa)
+        active &= (np.abs(fc) >= tol) & (error >= tol)
+        if not active.any():
+            break
+    return c, np.abs(fc), iters
+
+def secant_method_vec(f_expr: sp.Expr, x_sym: sp.Symbol, x0, x1, max_iter:int, tol:float):
+    """Batch secant iteration over arrays of start pairs (x0_k, x1_k).
+
+    Returns (roots, |f(root)|, iters) arrays; see bisection_method_vec.
+    """
+    f = _np_f(f_expr, x_sym)
+    x0, x1 = np.broadcast_arrays(np.atleast_1d(np.asarray(x0, dtype=float)),
+                                 np.atleast_1d(np.asarray(x1, dtype=float)))
+    x0, x1 = x0.copy(), x1.copy()
+    f0, f1 = f(x0), f(x1)
+    active = np.ones(x0.shape, dtype=bool)
+    iters = np.zeros(x0.shape, dtype=np.int64)
+    for _ in range(max_iter):
+        den = f1 - f0
+        if np.any(active & (den == 0)):
+            raise ZeroDivisionError("Zero denominator in Secant method.")
+        x2 = np.where(active, x1 - f1*(x1 - x0)/np.where(den == 0, 1.0, den), x1)
+        err = np.abs(x2 - x1)
+        f2 = np.where(active, f(x2), f1)
+        iters += active
+        x0 = np.where(active, x1, x0)
+        f0 = np.where(active, f1, f0)
+        x1, f1 = x2, f2
+        active &= (np.abs(f2) >= tol) & (err >= tol)
+        if not active.any():
+            break
+    return x1, np.abs(f1), iters
+
+def newton_raphson_vec(f_expr: sp.Expr, x_sym: sp.Symbol, x0, max_iter:int, tol:float):
+    """Batch Newton-Raphson over an array of initial guesses.
+
+    Returns (roots, |f(root)|, iters) arrays; see bisection_method_vec.
+    """
+    f = _np_f(f_expr, x_sym)
+    df = _np_f(_diff_cached(f_expr, x_sym), x_sym)
+    x = np.atleast_1d(np.asarray(x0, dtype=float)).copy()
+    active = np.ones(x.shape, dtype=bool)
+    iters = np.zeros(x.shape, dtype=np.int64)
+    for _ in range(max_iter):
+        dfx = df(x)
+        if np.any(active & (dfx == 0)):
+            raise ZeroDivisionError("Zero derivative in vectorized Newton-Raphson.")
+        x_new = np.where(active, x - f(x)/np.where(dfx == 0, 1.0, dfx), x)
+        err = np.abs(x_new - x)
+        iters += active
+        x = x_new
+        active &= err >= tol
+        if not active.any():
+            break
+    return x, np.abs(f(x)), iters